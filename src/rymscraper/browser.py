@@ -107,12 +107,16 @@ def _wait_for_content(
         True if content appeared, False on timeout.
     """
     effective_selector = selector or config.content_selector
-    deadline = time.time() + config.content_timeout
+    deadline = time.monotonic() + config.content_timeout
     turnstile_attempts = 0
-    poll_ms = int(config.selector_poll_interval * 1000)
-
-    while time.time() < deadline:
-        remaining_ms = int((deadline - time.time()) * 1000)
+    # Start with a short poll window so a challenge page is noticed
+    # quickly, then back off towards the configured interval. Both are
+    # clamped to 1 ms: Playwright treats timeout=0 as "wait forever".
+    poll_ms = max(1, int(config.selector_poll_initial * 1000))
+    max_poll_ms = max(1, int(config.selector_poll_interval * 1000))
+
+    while True:
+        remaining_ms = int((deadline - time.monotonic()) * 1000)
         if remaining_ms <= 0:
             break
 
@@ -145,7 +149,7 @@ def _wait_for_content(
                     "Content not ready, title: %s",
                     title,
                 )
-                time.sleep(config.post_turnstile_wait)
+            poll_ms = min(poll_ms * 2, max_poll_ms)
 
     return False
 
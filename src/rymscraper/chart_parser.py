@@ -5,7 +5,10 @@ from __future__ import annotations
 import re
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
+from bs4 import (  # type: ignore[attr-defined]
+    BeautifulSoup,
+    SoupStrainer,
+)
 
 from rymscraper.models import Album
 
@@ -18,6 +21,7 @@ _ARTIST_SELECTOR = (
     " a.artist span.ui_name_locale_original"
 )
 _DATE_SELECTOR = "div.page_charts_section_charts_item_date"
+_ITEM_STRAINER = SoupStrainer("div", class_="page_charts_section_charts_item")
 
 
 def parse_chart_page(html: str) -> list[Album]:
@@ -32,7 +36,7 @@ def parse_chart_page(html: str) -> list[Album]:
     if not html:
         return []
 
-    soup = BeautifulSoup(html, "lxml")
+    soup = BeautifulSoup(html, "lxml", parse_only=_ITEM_STRAINER)
     albums: list[Album] = []
 
     for item in soup.select(_ITEM_SELECTOR):
@@ -111,16 +111,11 @@ def _parse_types(
     return frozenset(ReleaseType(v) for v in values)
 
 
-def parse_args(
-    argv: list[str] | None = None,
-) -> argparse.Namespace:
-    """Parse command-line arguments.
-
-    Args:
-        argv: Argument list. Uses sys.argv if None.
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser.
 
     Returns:
-        Parsed argument namespace.
+        Configured argument parser.
     """
     parser = argparse.ArgumentParser(
         description=(
@@ -167,7 +162,21 @@ def parse_args(
             "uv pip install rymscraper[spotify]"
         ),
     )
-    return parser.parse_args(argv)
+    return parser
+
+
+def parse_args(
+    argv: list[str] | None = None,
+) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Args:
+        argv: Argument list. Uses sys.argv if None.
+
+    Returns:
+        Parsed argument namespace.
+    """
+    return build_parser().parse_args(argv)
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -5,7 +5,10 @@ from __future__ import annotations
 import re
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
+from bs4 import (  # type: ignore[attr-defined]
+    BeautifulSoup,
+    SoupStrainer,
+)
 
 from rymscraper.models import Album
 
@@ -13,6 +16,7 @@ _ITEM_SELECTOR = "div.or_q_albumartist"
 _ARTIST_SELECTOR = "a.artist"
 _ALBUM_SELECTOR = "a.album"
 _YEAR_SELECTOR = "span.smallgray"
+_ITEM_STRAINER = SoupStrainer("div", class_="or_q_albumartist")
 
 
 def parse_collection_page(html: str) -> list[Album]:
@@ -27,7 +31,7 @@ def parse_collection_page(html: str) -> list[Album]:
     if not html:
         return []
 
-    soup = BeautifulSoup(html, "lxml")
+    soup = BeautifulSoup(html, "lxml", parse_only=_ITEM_STRAINER)
     albums: list[Album] = []
 
     for item in soup.select(_ITEM_SELECTOR):
@@ -23,6 +23,7 @@ class ScraperConfig:
 
     # Timeouts (all in seconds)
     content_timeout: float = 90.0
+    selector_poll_initial: float = 0.5
     selector_poll_interval: float = 5.0
     turnstile_wait: float = 3.0
     post_turnstile_wait: float = 2.0
@@ -6,6 +6,8 @@ import re
 from dataclasses import dataclass
 from enum import Enum
 
+_LINE_RE = re.compile(r"^(.+?)\s*-\s*(.+?)(?:\s*\((\d{4})\))?\s*$")
+
 
 class ReleaseType(Enum):
     """Release type categories from RYM artist pages."""
@@ -51,10 +53,7 @@ class Album:
         Raises:
             ValueError: If line cannot be parsed.
         """
-        match = re.match(
-            r"^(.+?)\s*-\s*(.+?)(?:\s*\((\d{4})\))?\s*$",
-            line,
-        )
+        match = _LINE_RE.match(line)
         if not match:
             raise ValueError(f"Cannot parse album line: {line!r}")
         return cls(
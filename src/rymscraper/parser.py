@@ -3,14 +3,38 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
+from bs4 import (  # type: ignore[attr-defined]
+    BeautifulSoup,
+    SoupStrainer,
+)
 
 from rymscraper.config import ScraperConfig
 from rymscraper.models import Album
 
 _DEFAULT_CONFIG = ScraperConfig()
+# Album data only ever lives in table rows; skip building the rest
+# when the configured cell selectors do not look outside the row.
+_ROW_STRAINER = SoupStrainer("tr")
+_COMBINATOR_RE = re.compile(r"[\s>+~]")
+
+
+def _is_row_local(selector: str) -> bool:
+    """Check whether a CSS selector can match without row ancestors.
+
+    Args:
+        selector: CSS selector, possibly a comma-separated group.
+
+    Returns:
+        True if every selector in the group is a single compound
+        selector (no descendant, child, or sibling combinators).
+    """
+    return all(
+        part.strip() and not _COMBINATOR_RE.search(part.strip())
+        for part in selector.split(",")
+    )
 
 
 def parse_page(
@@ -29,7 +53,19 @@ def parse_page(
     if not html:
         return []
 
-    soup = BeautifulSoup(html, "lxml")
+    row_local = all(
+        _is_row_local(s)
+        for s in (
+            config.artist_selector,
+            config.album_selector,
+            config.year_selector,
+        )
+    )
+    soup = BeautifulSoup(
+        html,
+        "lxml",
+        parse_only=_ROW_STRAINER if row_local else None,
+    )
     albums: list[Album] = []
 
     for row in soup.select("tr"):
@@ -75,6 +111,9 @@ def find_next_page_url(
     Returns:
         Absolute URL of the next page, or None.
     """
+    if not html:
+        return None
+
     soup = BeautifulSoup(html, "lxml")
 
     for selector in config.next_page_selectors:
@@ -86,6 +125,7 @@ def find_next_page_url(
     return None
 
 
+@lru_cache(maxsize=1024)
 def extract_slug(url: str) -> str:
     """Extract list slug from RYM URL for output filename.
 
@@ -1,8 +1,9 @@
 """Tests for browser module (unit-testable parts only)."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
 
 from rymscraper.browser import _wait_for_content, is_cloudflare_challenge
 from rymscraper.config import ScraperConfig
@@ -10,17 +11,21 @@ from rymscraper.models import ReleaseType
 
 
 class TestIsCloudflareChallenge:
-    def test_detects_cloudflare(self) -> None:
-        assert is_cloudflare_challenge("Just a moment...") is True
-
-    def test_detects_lowercase(self) -> None:
-        assert is_cloudflare_challenge("just a moment") is True
-
-    def test_normal_title(self) -> None:
-        assert is_cloudflare_challenge("Best Albums of 2024") is False
-
-    def test_empty_title(self) -> None:
-        assert is_cloudflare_challenge("") is False
+    @pytest.mark.parametrize(
+        ("title", "expected"),
+        [
+            ("Just a moment...", True),
+            ("just a moment", True),
+            ("Best Albums of 2024", False),
+            ("", False),
+        ],
+    )
+    def test_is_cloudflare_challenge(
+        self,
+        title: str,
+        expected: bool,
+    ) -> None:
+        assert is_cloudflare_challenge(title) is expected
 
 
 @pytest.fixture()
@@ -29,7 +34,7 @@ def mock_page() -> MagicMock:
     return MagicMock()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def config() -> ScraperConfig:
     """Create a default scraper config."""
     return ScraperConfig()
@@ -52,6 +57,62 @@ def test_wait_for_content_custom_selector(
     assert call_args[0][0] == ".custom_selector"
 
 
+@patch("rymscraper.browser.time")
+def test_wait_for_content_times_out(
+    mock_time: MagicMock,
+    mock_page: MagicMock,
+    config: ScraperConfig,
+) -> None:
+    """Returns False once the monotonic deadline has passed."""
+    mock_time.monotonic.side_effect = [0.0, 0.0, config.content_timeout]
+    mock_page.wait_for_selector.side_effect = PlaywrightTimeout("timeout")
+    mock_page.title.return_value = "Best Albums of 2024"
+
+    assert _wait_for_content(mock_page, config) is False
+    mock_page.wait_for_selector.assert_called_once()
+    mock_time.sleep.assert_not_called()
+
+
+def test_wait_for_content_backs_off_poll_window(
+    mock_page: MagicMock,
+    config: ScraperConfig,
+) -> None:
+    """Poll window doubles on each miss up to the configured cap."""
+    mock_page.wait_for_selector.side_effect = [
+        PlaywrightTimeout("timeout"),
+        PlaywrightTimeout("timeout"),
+        PlaywrightTimeout("timeout"),
+        PlaywrightTimeout("timeout"),
+        PlaywrightTimeout("timeout"),
+        True,
+    ]
+    mock_page.title.return_value = "Best Albums of 2024"
+
+    assert _wait_for_content(mock_page, config) is True
+    timeouts = [
+        c.kwargs["timeout"] for c in mock_page.wait_for_selector.call_args_list
+    ]
+    assert timeouts == [500, 1000, 2000, 4000, 5000, 5000]
+
+
+def test_wait_for_content_zero_poll_window_is_clamped(
+    mock_page: MagicMock,
+) -> None:
+    """A zero initial poll window never becomes an unbounded wait."""
+    config = ScraperConfig(selector_poll_initial=0.0)
+    mock_page.wait_for_selector.side_effect = [
+        PlaywrightTimeout("timeout"),
+        True,
+    ]
+    mock_page.title.return_value = "Best Albums of 2024"
+
+    assert _wait_for_content(mock_page, config) is True
+    timeouts = [
+        c.kwargs["timeout"] for c in mock_page.wait_for_selector.call_args_list
+    ]
+    assert timeouts == [1, 2]
+
+
 def test_expand_sections_clicks_show_all(
     mock_page: MagicMock,
 ) -> None:
@@ -10,161 +10,176 @@ import pytest
 from rymscraper.artist_parser import DEFAULT_TYPES
 from rymscraper.cli import (
     _parse_types,
+    build_parser,
     is_artist_url,
     is_chart_url,
     is_collection_url,
-    parse_args,
     validate_url,
 )
 from rymscraper.models import ReleaseType
 
 if TYPE_CHECKING:
+    import argparse
     from pathlib import Path
 
 
-class TestValidateUrl:
-    def test_valid_rym_url(self) -> None:
-        url = "https://rateyourmusic.com/list/u/test/"
-        assert validate_url(url) is True
+@pytest.fixture(scope="session")
+def cli_parser() -> argparse.ArgumentParser:
+    """Argument parser shared across tests (parsing never mutates it)."""
+    return build_parser()
 
-    def test_invalid_domain(self) -> None:
-        assert validate_url("https://example.com/") is False
 
-    def test_empty_url(self) -> None:
-        assert validate_url("") is False
+class TestValidateUrl:
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://rateyourmusic.com/list/u/test/", True),
+            ("https://example.com/", False),
+            ("", False),
+        ],
+    )
+    def test_validate_url(self, url: str, expected: bool) -> None:
+        assert validate_url(url) is expected
 
 
 class TestParseArgs:
-    def test_minimal_args(self) -> None:
+    def test_minimal_args(
+        self,
+        cli_parser: argparse.ArgumentParser,
+    ) -> None:
         url = "https://rateyourmusic.com/list/u/test/"
-        args = parse_args([url])
+        args = cli_parser.parse_args([url])
         assert args.url == url
         assert args.output is None
         assert args.headless is False
         assert args.verbose is False
 
-    def test_output_flag(self) -> None:
+    def test_output_flag(
+        self,
+        cli_parser: argparse.ArgumentParser,
+    ) -> None:
         url = "https://rateyourmusic.com/list/u/test/"
-        args = parse_args(["-o", "out.txt", url])
+        args = cli_parser.parse_args(["-o", "out.txt", url])
         assert args.output == "out.txt"
 
-    def test_headless_flag(self) -> None:
+    def test_headless_flag(
+        self,
+        cli_parser: argparse.ArgumentParser,
+    ) -> None:
         url = "https://rateyourmusic.com/list/u/test/"
-        args = parse_args(["--headless", url])
+        args = cli_parser.parse_args(["--headless", url])
         assert args.headless is True
 
-    def test_verbose_flag(self) -> None:
+    def test_verbose_flag(
+        self,
+        cli_parser: argparse.ArgumentParser,
+    ) -> None:
         url = "https://rateyourmusic.com/list/u/test/"
-        args = parse_args(["-v", url])
+        args = cli_parser.parse_args(["-v", url])
         assert args.verbose is True
 
-    def test_types_flag(self) -> None:
+    def test_types_flag(
+        self,
+        cli_parser: argparse.ArgumentParser,
+    ) -> None:
         url = "https://rateyourmusic.com/artist/neurosis"
-        args = parse_args(["--types", "album,ep", url])
+        args = cli_parser.parse_args(["--types", "album,ep", url])
         assert args.types == "album,ep"
 
-    def test_types_default_none(self) -> None:
+    def test_types_default_none(
+        self,
+        cli_parser: argparse.ArgumentParser,
+    ) -> None:
         url = "https://rateyourmusic.com/artist/neurosis"
-        args = parse_args([url])
+        args = cli_parser.parse_args([url])
         assert args.types is None
 
 
 class TestIsArtistUrl:
-    def test_artist_url(self) -> None:
-        url = "https://rateyourmusic.com/artist/neurosis"
-        assert is_artist_url(url) is True
-
-    def test_list_url(self) -> None:
-        url = "https://rateyourmusic.com/list/user/my-list"
-        assert is_artist_url(url) is False
-
-    def test_artist_url_trailing_slash(self) -> None:
-        url = "https://rateyourmusic.com/artist/neurosis/"
-        assert is_artist_url(url) is True
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://rateyourmusic.com/artist/neurosis", True),
+            ("https://rateyourmusic.com/list/user/my-list", False),
+            ("https://rateyourmusic.com/artist/neurosis/", True),
+        ],
+    )
+    def test_is_artist_url(self, url: str, expected: bool) -> None:
+        assert is_artist_url(url) is expected
 
 
 class TestParseTypes:
-    def test_valid_types(self) -> None:
-        result = _parse_types("album,ep")
-        assert result == frozenset(
-            {
-                ReleaseType.ALBUM,
-                ReleaseType.EP,
-            }
-        )
-
-    def test_none_returns_default(self) -> None:
-        assert _parse_types(None) == DEFAULT_TYPES
-
-    def test_single_type(self) -> None:
-        result = _parse_types("album")
-        assert result == frozenset({ReleaseType.ALBUM})
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("album,ep", frozenset({ReleaseType.ALBUM, ReleaseType.EP})),
+            ("album", frozenset({ReleaseType.ALBUM})),
+            ("album , ep", frozenset({ReleaseType.ALBUM, ReleaseType.EP})),
+            (None, DEFAULT_TYPES),
+        ],
+    )
+    def test_valid_types(
+        self,
+        raw: str | None,
+        expected: frozenset[ReleaseType],
+    ) -> None:
+        assert _parse_types(raw) == expected
 
     def test_invalid_type_raises(self) -> None:
         with pytest.raises(ValueError):
             _parse_types("album,foo")
 
-    def test_strips_whitespace(self) -> None:
-        result = _parse_types("album , ep")
-        assert result == frozenset(
-            {
-                ReleaseType.ALBUM,
-                ReleaseType.EP,
-            }
-        )
-
 
 class TestIsChartUrl:
-    def test_chart_url(self) -> None:
-        url = "https://rateyourmusic.com/charts/top/album/all-time/g:deathrock/"
-        assert is_chart_url(url) is True
-
-    def test_chart_url_with_page(self) -> None:
-        url = (
-            "https://rateyourmusic.com/charts/top/album/all-time/g:deathrock/2/"
-        )
-        assert is_chart_url(url) is True
-
-    def test_list_url_not_chart(self) -> None:
-        url = "https://rateyourmusic.com/list/user/test"
-        assert is_chart_url(url) is False
-
-    def test_artist_url_not_chart(self) -> None:
-        url = "https://rateyourmusic.com/artist/neurosis"
-        assert is_chart_url(url) is False
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            (
+                "https://rateyourmusic.com/charts/top/album/all-time/g:deathrock/",
+                True,
+            ),
+            (
+                "https://rateyourmusic.com/charts/top/album/all-time/g:deathrock/2/",
+                True,
+            ),
+            ("https://rateyourmusic.com/list/user/test", False),
+            ("https://rateyourmusic.com/artist/neurosis", False),
+        ],
+    )
+    def test_is_chart_url(self, url: str, expected: bool) -> None:
+        assert is_chart_url(url) is expected
 
 
 class TestIsCollectionUrl:
-    def test_collection_url(self) -> None:
-        url = "https://rateyourmusic.com/collection/stonepig/r5.0"
-        assert is_collection_url(url) is True
-
-    def test_collection_url_bare(self) -> None:
-        url = "https://rateyourmusic.com/collection/stonepig/"
-        assert is_collection_url(url) is True
-
-    def test_collection_url_with_page(self) -> None:
-        url = "https://rateyourmusic.com/collection/stonepig/r5.0/2"
-        assert is_collection_url(url) is True
-
-    def test_list_url_not_collection(self) -> None:
-        url = "https://rateyourmusic.com/list/user/test"
-        assert is_collection_url(url) is False
-
-    def test_artist_url_not_collection(self) -> None:
-        url = "https://rateyourmusic.com/artist/neurosis"
-        assert is_collection_url(url) is False
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://rateyourmusic.com/collection/stonepig/r5.0", True),
+            ("https://rateyourmusic.com/collection/stonepig/", True),
+            ("https://rateyourmusic.com/collection/stonepig/r5.0/2", True),
+            ("https://rateyourmusic.com/list/user/test", False),
+            ("https://rateyourmusic.com/artist/neurosis", False),
+        ],
+    )
+    def test_is_collection_url(self, url: str, expected: bool) -> None:
+        assert is_collection_url(url) is expected
 
 
 class TestSpotifyFlag:
-    def test_spotify_flag_default_false(self) -> None:
+    def test_spotify_flag_default_false(
+        self,
+        cli_parser: argparse.ArgumentParser,
+    ) -> None:
         url = "https://rateyourmusic.com/list/u/test/"
-        args = parse_args([url])
+        args = cli_parser.parse_args([url])
         assert args.spotify is False
 
-    def test_spotify_flag_set(self) -> None:
+    def test_spotify_flag_set(
+        self,
+        cli_parser: argparse.ArgumentParser,
+    ) -> None:
         url = "https://rateyourmusic.com/list/u/test/"
-        args = parse_args(["--spotify", url])
+        args = cli_parser.parse_args(["--spotify", url])
         assert args.spotify is True
 
 
@@ -4,23 +4,30 @@ import pytest
 
 from rymscraper.models import Album, ReleaseType
 
+# Album is frozen, so read-only tests can share these instances.
+RADIOHEAD_OK_1997 = Album("Radiohead", "OK Computer", "1997")
+RADIOHEAD_OK_NO_YEAR = Album("Radiohead", "OK Computer", "")
+NEUROSIS_SAZ = Album("Neurosis", "Souls at Zero", "1992")
+NEUROSIS_SAZ_ALBUM = Album(
+    "Neurosis",
+    "Souls at Zero",
+    "1992",
+    release_type=ReleaseType.ALBUM,
+)
+NEUROSIS_SAZ_EP = Album(
+    "Neurosis",
+    "Souls at Zero",
+    "1992",
+    release_type=ReleaseType.EP,
+)
+
 
 class TestAlbum:
     def test_str_with_year(self) -> None:
-        album = Album(
-            artist="Radiohead",
-            title="OK Computer",
-            year="1997",
-        )
-        assert str(album) == "Radiohead - OK Computer (1997)"
+        assert str(RADIOHEAD_OK_1997) == "Radiohead - OK Computer (1997)"
 
     def test_str_without_year(self) -> None:
-        album = Album(
-            artist="Radiohead",
-            title="OK Computer",
-            year="",
-        )
-        assert str(album) == "Radiohead - OK Computer"
+        assert str(RADIOHEAD_OK_NO_YEAR) == "Radiohead - OK Computer"
 
     def test_frozen(self) -> None:
         """Album instances should be immutable."""
@@ -35,19 +42,11 @@ class TestAlbum:
 class TestAlbumFromLine:
     def test_with_year(self) -> None:
         album = Album.from_line("Radiohead - OK Computer (1997)")
-        assert album == Album(
-            "Radiohead",
-            "OK Computer",
-            "1997",
-        )
+        assert album == RADIOHEAD_OK_1997
 
     def test_without_year(self) -> None:
         album = Album.from_line("Radiohead - OK Computer")
-        assert album == Album(
-            "Radiohead",
-            "OK Computer",
-            "",
-        )
+        assert album == RADIOHEAD_OK_NO_YEAR
 
     def test_invalid_format(self) -> None:
         with pytest.raises(ValueError, match="parse"):
@@ -61,27 +60,10 @@ class TestReleaseType:
         assert ReleaseType.LIVE_ALBUM.value == "live_album"
 
     def test_album_release_type_default_none(self) -> None:
-        album = Album(
-            artist="Neurosis",
-            title="Souls at Zero",
-            year="1992",
-        )
-        assert album.release_type is None
+        assert NEUROSIS_SAZ.release_type is None
 
     def test_album_with_release_type(self) -> None:
-        album = Album(
-            artist="Neurosis",
-            title="Souls at Zero",
-            year="1992",
-            release_type=ReleaseType.ALBUM,
-        )
-        assert album.release_type == ReleaseType.ALBUM
+        assert NEUROSIS_SAZ_ALBUM.release_type == ReleaseType.ALBUM
 
     def test_album_str_ignores_release_type(self) -> None:
-        album = Album(
-            artist="Neurosis",
-            title="Souls at Zero",
-            year="1992",
-            release_type=ReleaseType.EP,
-        )
-        assert str(album) == "Neurosis - Souls at Zero (1992)"
+        assert str(NEUROSIS_SAZ_EP) == "Neurosis - Souls at Zero (1992)"
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from rymscraper.config import ScraperConfig
 from rymscraper.models import Album
 from rymscraper.parser import (
     extract_slug,
@@ -11,37 +12,50 @@ from rymscraper.parser import (
     parse_page,
 )
 
-FIXTURES = Path(__file__).parent / "fixtures"
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
 
+# Read every fixture once at import so a missing or undecodable file
+# fails collection instead of a single test.
+_HTML = {
+    name: (FIXTURES / f"{name}.html").read_bytes().decode("utf-8")
+    for name in (
+        "single_page",
+        "no_albums",
+        "missing_year",
+        "with_pagination",
+        "no_next_page",
+    )
+}
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def single_page_html() -> str:
     """HTML with two valid album rows."""
-    return (FIXTURES / "single_page.html").read_text()
+    return _HTML["single_page"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def no_albums_html() -> str:
     """HTML with no album data."""
-    return (FIXTURES / "no_albums.html").read_text()
+    return _HTML["no_albums"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def missing_year_html() -> str:
     """HTML with album missing year element."""
-    return (FIXTURES / "missing_year.html").read_text()
+    return _HTML["missing_year"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def paginated_html() -> str:
     """HTML with a next-page link."""
-    return (FIXTURES / "with_pagination.html").read_text()
+    return _HTML["with_pagination"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def unpaginated_html() -> str:
     """HTML without a next-page link."""
-    return (FIXTURES / "no_next_page.html").read_text()
+    return _HTML["no_next_page"]
 
 
 class TestParsePage:
@@ -72,6 +86,14 @@ class TestParsePage:
     def test_empty_html(self) -> None:
         assert parse_page("") == []
 
+    def test_ancestor_qualified_selector(
+        self,
+        single_page_html: str,
+    ) -> None:
+        config = ScraperConfig(artist_selector="table .list_artist")
+        albums = parse_page(single_page_html, config)
+        assert [a.artist for a in albums] == ["Radiohead", "Björk"]
+
 
 class TestFindNextPageUrl:
     def test_finds_navlinknext(
@@ -95,6 +117,19 @@ class TestFindNextPageUrl:
             is None
         )
 
+    def test_ancestor_qualified_selector(
+        self,
+        paginated_html: str,
+    ) -> None:
+        base = "https://rateyourmusic.com/list/test/"
+        config = ScraperConfig(next_page_selectors=("body a.navlinknext",))
+        url = find_next_page_url(paginated_html, base, config)
+        assert url == "https://rateyourmusic.com/list/test/2/"
+
+    def test_none_for_empty_html(self) -> None:
+        base = "https://rateyourmusic.com/list/test/"
+        assert find_next_page_url("", base) is None
+
 
 class TestExtractSlug:
     def test_simple_slug(self) -> None:
@@ -1,7 +1,10 @@
 """Tests for Spotify integration."""
 
+from collections.abc import Iterator
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from rymscraper.models import Album
 from rymscraper.spotify import (
     add_album_tracks,
@@ -207,20 +210,28 @@ class TestAddAlbumTracks:
         assert len(second_call[0][1]) == 50
 
 
+@pytest.fixture
+def sync_client() -> Iterator[MagicMock]:
+    """Spotify client with no playlists, patched into sync."""
+    sp = MagicMock()
+    sp.current_user.return_value = {"id": "u1"}
+    sp.current_user_playlists.return_value = {
+        "items": [],
+        "next": None,
+    }
+    sp.user_playlist_create.return_value = {
+        "id": "pl1",
+    }
+    with patch(
+        "rymscraper.spotify.get_spotify_client",
+        return_value=sp,
+    ):
+        yield sp
+
+
 class TestSyncAlbumsToSpotify:
-    @patch("rymscraper.spotify.get_spotify_client")
-    def test_mixed_results(self, mock_get_client: MagicMock) -> None:
+    def test_mixed_results(self, sync_client: MagicMock) -> None:
         """Returns not-found albums; adds found ones."""
-        sp = MagicMock()
-        mock_get_client.return_value = sp
-        sp.current_user.return_value = {"id": "u1"}
-        sp.current_user_playlists.return_value = {
-            "items": [],
-            "next": None,
-        }
-        sp.user_playlist_create.return_value = {
-            "id": "pl1",
-        }
 
         def search_side_effect(
             q: str,
@@ -235,8 +246,8 @@ class TestSyncAlbumsToSpotify:
                 }
             return {"albums": {"items": []}}
 
-        sp.search.side_effect = search_side_effect
-        sp.album_tracks.return_value = {
+        sync_client.search.side_effect = search_side_effect
+        sync_client.album_tracks.return_value = {
             "items": [{"uri": "spotify:track:1"}],
         }
 
@@ -252,25 +263,14 @@ class TestSyncAlbumsToSpotify:
         assert len(result) == 1
         assert result[0].artist == "Unknown"
 
-    @patch("rymscraper.spotify.get_spotify_client")
-    def test_all_found(self, mock_get_client: MagicMock) -> None:
+    def test_all_found(self, sync_client: MagicMock) -> None:
         """Returns empty list when all albums found."""
-        sp = MagicMock()
-        mock_get_client.return_value = sp
-        sp.current_user.return_value = {"id": "u1"}
-        sp.current_user_playlists.return_value = {
-            "items": [],
-            "next": None,
-        }
-        sp.user_playlist_create.return_value = {
-            "id": "pl1",
-        }
-        sp.search.return_value = {
+        sync_client.search.return_value = {
             "albums": {
                 "items": [{"id": "alb1"}],
             },
         }
-        sp.album_tracks.return_value = {
+        sync_client.album_tracks.return_value = {
             "items": [{"uri": "spotify:track:1"}],
         }
 
@@ -284,20 +284,9 @@ class TestSyncAlbumsToSpotify:
 
         assert result == []
 
-    @patch("rymscraper.spotify.get_spotify_client")
-    def test_none_found(self, mock_get_client: MagicMock) -> None:
+    def test_none_found(self, sync_client: MagicMock) -> None:
         """Returns all albums when none found."""
-        sp = MagicMock()
-        mock_get_client.return_value = sp
-        sp.current_user.return_value = {"id": "u1"}
-        sp.current_user_playlists.return_value = {
-            "items": [],
-            "next": None,
-        }
-        sp.user_playlist_create.return_value = {
-            "id": "pl1",
-        }
-        sp.search.return_value = {
+        sync_client.search.return_value = {
             "albums": {"items": []},
         }
 
@@ -311,28 +300,17 @@ class TestSyncAlbumsToSpotify:
 
         assert result == albums
 
-    @patch("rymscraper.spotify.get_spotify_client")
     def test_playlist_description_has_rym_url(
-        self, mock_get_client: MagicMock
+        self, sync_client: MagicMock
     ) -> None:
         """Playlist description includes the RYM URL."""
-        sp = MagicMock()
-        mock_get_client.return_value = sp
-        sp.current_user.return_value = {"id": "u1"}
-        sp.current_user_playlists.return_value = {
-            "items": [],
-            "next": None,
-        }
-        sp.user_playlist_create.return_value = {
-            "id": "pl1",
-        }
-        sp.search.return_value = {
+        sync_client.search.return_value = {
             "albums": {"items": []},
         }
 
         url = "https://rateyourmusic.com/list/user/my-list"
         sync_albums_to_spotify([Album("A", "B", "2000")], "Test", url)
 
-        create_call = sp.user_playlist_create.call_args
+        create_call = sync_client.user_playlist_create.call_args
         desc = create_call[1]["description"]
         assert url in desc